@@ -12,6 +12,9 @@ ATTRACTIVE_GAIN = 1.0       # Goal attraction coefficient
 REPULSIVE_GAIN = 50.0       # Obstacle repulsion coefficient
 OBSTACLE_INFLUENCE = 3      # Repulsive field radius (grid cells)
 
+# Compiled Kernel Threshold
+NUMBA_MIN_CELLS = 250000    # Smaller grids skip numba, its load cost exceeds the planning time
+
 # Robot Geometric Configuration
 ROBOT_WIDTH = 2             # Horizontal dimension (grid cells)
 ROBOT_HEIGHT = 2            # Vertical dimension (grid cells)
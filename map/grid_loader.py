@@ -1,12 +1,13 @@
 import os
-from config.settings import START, GOAL
+import numpy as np
+from config.settings import START, GOAL, OBSTACLE
 
 def load_grid(file_path):
     """
     Loads a grid map from a text file, It reads each row - Converts text → numbers - So "0 1 0 3" becomes [0, 1, 0, 3] - 
     Finds start & goal locations 
     Returns:
-        grid: 2D list of ints
+        grid: 2D uint8 ndarray
         start: (row, col)
         goal: (row, col)
     """
@@ -36,4 +37,19 @@ def load_grid(file_path):
     if goal is None:
         raise ValueError("Goal point (3) not found in map file.")
 
-    return grid, start, goal
+    # Single canonical array shared (read-only) by every pipeline stage
+    return np.asarray(grid, dtype=np.uint8), start, goal
+
+
+def to_obstacle_mask(grid):
+    """
+    Converts an occupancy grid to the boolean form used by the planner.
+    Boolean grids are treated as masks already and are returned unchanged.
+
+    Returns:
+        2D bool ndarray, True where the cell is an obstacle
+    """
+    grid = np.asarray(grid)
+    if grid.dtype == bool:
+        return grid
+    return grid == OBSTACLE
@@ -0,0 +1,86 @@
+import heapq
+import numpy as np
+from planner.path_extractor import DIR_DR, DIR_DC, EDGE_COSTS
+from planner._numba_compat import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def astar(potential, start_row, start_col, goal_row, goal_col):
+    """
+    Compiled A* search over a C-contiguous potential array.
+    Positions are encoded as flat indices row * grid_cols + col.
+
+    Returns:
+        tuple: (parent_array, explored_node_count, goal_reached)
+    """
+    grid_rows, grid_cols = potential.shape
+    heuristic = potential.ravel()
+    num_cells = grid_rows * grid_cols
+
+    start = start_row * grid_cols + start_col
+    goal = goal_row * grid_cols + goal_col
+
+    # Optimal cost and predecessor for each flat position
+    g_score = np.full(num_cells, np.inf)
+    parent = np.full(num_cells, -1, dtype=np.int64)
+    g_score[start] = 0.0
+
+    # Min-heap priority queue: (total_cost, accumulated_cost, position)
+    frontier = [(np.float64(heuristic[start]), 0.0, np.int64(start))]
+
+    # Last relaxed entry, held back so it can be merged with the next pop
+    pending_entry = frontier[0]
+    has_pending = False
+
+    # Iteration limit for computational safety
+    iteration_limit = num_cells * 4
+    iteration_count = 0
+    explored_nodes = 0
+
+    while (len(frontier) > 0 or has_pending) and iteration_count < iteration_limit:
+        iteration_count += 1
+        if not has_pending:
+            total_cost, accumulated_cost, current = heapq.heappop(frontier)
+        else:
+            # Push the held entry and pop the minimum in a single sift
+            total_cost, accumulated_cost, current = heapq.heappushpop(frontier, pending_entry)
+            has_pending = False
+
+        # Lazy deletion: skip entries superseded by a cheaper path
+        if accumulated_cost > g_score[current]:
+            continue
+        explored_nodes += 1
+
+        if current == goal:
+            return parent, explored_nodes, True
+
+        row = current // grid_cols
+        col = current % grid_cols
+
+        for k in range(DIR_DR.shape[0]):
+            next_row = row + DIR_DR[k]
+            next_col = col + DIR_DC[k]
+
+            # Boundary validation
+            if next_row < 0 or next_row >= grid_rows or next_col < 0 or next_col >= grid_cols:
+                continue
+
+            next_pos = next_row * grid_cols + next_col
+
+            # Obstacle check
+            if np.isinf(heuristic[next_pos]):
+                continue
+
+            new_accumulated_cost = accumulated_cost + EDGE_COSTS[k]
+
+            # Update if better path found
+            if new_accumulated_cost < g_score[next_pos]:
+                g_score[next_pos] = new_accumulated_cost
+                parent[next_pos] = current
+                estimated_total = new_accumulated_cost + heuristic[next_pos]
+                if has_pending:
+                    heapq.heappush(frontier, pending_entry)
+                pending_entry = (estimated_total, new_accumulated_cost, next_pos)
+                has_pending = True
+
+    return parent, explored_nodes, False
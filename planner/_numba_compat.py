@@ -0,0 +1,12 @@
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator leaving the kernel as plain Python."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda function: function
@@ -0,0 +1,31 @@
+import math
+import numpy as np
+from planner._numba_compat import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(parallel=True, cache=True)
+def build_potential_field(obstacle_mask, repulsive_potential, goal_row, goal_col, attractive_gain):
+    """
+    Compiled single-pass superposition of attractive and repulsive potentials.
+    Rows are independent and are distributed across threads.
+    The gain is passed in rather than read as a global so cached builds never go stale.
+
+    Returns:
+        2D float32 array of potential values (obstacles are inf)
+    """
+    grid_rows, grid_cols = obstacle_mask.shape
+    potential_field = np.empty((grid_rows, grid_cols), dtype=np.float32)
+
+    for row in prange(grid_rows):
+        for col in range(grid_cols):
+            if obstacle_mask[row, col]:
+                potential_field[row, col] = np.inf
+                continue
+
+            # Attractive term in float32, matching the NumPy float32 index-grid build
+            goal_distance = np.float32(math.hypot(row - goal_row, col - goal_col))
+            attractive_potential = np.float32(np.float32(attractive_gain) * goal_distance)
+
+            potential_field[row, col] = attractive_potential + repulsive_potential[row, col]
+
+    return potential_field
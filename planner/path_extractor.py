@@ -1,5 +1,7 @@
 import math
-from collections import deque
+from collections import deque, Counter
+import numpy as np
+from config.settings import NUMBA_MIN_CELLS
 
 # Direction vectors for 8-connected grid navigation
 DIRECTION_OFFSETS = [
@@ -13,6 +15,12 @@ DIRECTION_OFFSETS = [
     (1, 1),    # southeast
 ]
 
+# Per-direction lookup tables aligned with DIRECTION_OFFSETS
+SQRT2 = math.sqrt(2)
+DIR_DR = np.array([dr for dr, _ in DIRECTION_OFFSETS], dtype=np.int64)
+DIR_DC = np.array([dc for _, dc in DIRECTION_OFFSETS], dtype=np.int64)
+EDGE_COSTS = np.array([SQRT2 if dr and dc else 1.0 for dr, dc in DIRECTION_OFFSETS], dtype=np.float64)
+
 def extract_path(potential, start, goal, statistics=None):
     """
     Extracts a path from start to goal using the potential field.
@@ -20,7 +28,7 @@ def extract_path(potential, start, goal, statistics=None):
     Fallback method: Steepest descent on potential gradient.
 
     Args:
-        potential: 2D array of potential values
+        potential: 2D ndarray of potential values
         start: tuple (row, col) for starting location
         goal: tuple (row, col) for target location
         statistics: optional PlanningStatistics tracker
@@ -53,63 +61,121 @@ def compute_astar_path(potential, start, goal):
     """
     Implements A* algorithm with potential field as heuristic function.
 
+    Uses the Numba-compiled search kernel on grids of at least NUMBA_MIN_CELLS
+    cells when numba is installed.
+
     Returns:
         tuple: (waypoint_list, explored_node_count)
     """
-    from heapq import heappush, heappop
+    if potential.size >= NUMBA_MIN_CELLS:
+        from planner._astar_numba import NUMBA_AVAILABLE, astar
+
+        if NUMBA_AVAILABLE:
+            parent, explored_nodes, goal_reached = astar(
+                np.ascontiguousarray(potential), start[0], start[1], goal[0], goal[1]
+            )
+            if not goal_reached:
+                return [], explored_nodes
+            return reconstruct_path(parent, potential.shape[1], start, goal), explored_nodes
+
+    from heapq import heappush, heappop, heappushpop
 
-    grid_rows = len(potential)
-    grid_cols = len(potential[0])
+    grid_rows, grid_cols = potential.shape
 
-    # Min-heap priority queue: (total_cost, accumulated_cost, position, trajectory)
+    # Positions are encoded as flat indices row * grid_cols + col
+    start_index = start[0] * grid_cols + start[1]
+    goal_index = goal[0] * grid_cols + goal[1]
+
+    # Flat heuristic read with the same index as every other per-position table
+    heuristic = np.ascontiguousarray(potential).ravel().tolist()
+
+    # Min-heap priority queue: (total_cost, accumulated_cost, position)
     frontier = []
-    heappush(frontier, (potential[start[0]][start[1]], 0, start, [start]))
+    heappush(frontier, (heuristic[start_index], 0.0, start_index))
+
+    # Last relaxed entry, held back so it can be merged with the next pop
+    pending_entry = None
 
-    # Maintain optimal cost to reach each position
-    cost_map = {start: 0}
+    # Maintain optimal cost and predecessor for each position
+    g_score = np.full(grid_rows * grid_cols, np.inf)
+    parent = np.full(grid_rows * grid_cols, -1, dtype=np.int64)
+    g_score[start_index] = 0.0
+
+    # Native-scalar copy of the direction tables for the interpreter loop
+    direction_steps = list(zip(DIR_DR.tolist(), DIR_DC.tolist(), EDGE_COSTS.tolist()))
 
     # Iteration limit for computational safety
     iteration_limit = grid_rows * grid_cols * 4
     iteration_count = 0
     explored_nodes = 0
 
-    while frontier and iteration_count < iteration_limit:
+    while (frontier or pending_entry is not None) and iteration_count < iteration_limit:
         iteration_count += 1
-        total_cost, accumulated_cost, current_pos, trajectory = heappop(frontier)
+        if pending_entry is None:
+            total_cost, accumulated_cost, current_pos = heappop(frontier)
+        else:
+            # Push the held entry and pop the minimum in a single sift
+            total_cost, accumulated_cost, current_pos = heappushpop(frontier, pending_entry)
+            pending_entry = None
+
+        # Lazy deletion: skip entries superseded by a cheaper path
+        if accumulated_cost > g_score[current_pos]:
+            continue
         explored_nodes += 1
 
-        if current_pos == goal:
-            return trajectory, explored_nodes
+        if current_pos == goal_index:
+            return reconstruct_path(parent, grid_cols, start, goal), explored_nodes
 
-        row, col = current_pos
+        row, col = divmod(current_pos, grid_cols)
 
-        for delta_row, delta_col in DIRECTION_OFFSETS:
+        for delta_row, delta_col, edge_cost in direction_steps:
             next_row, next_col = row + delta_row, col + delta_col
 
             # Boundary validation
             if not (0 <= next_row < grid_rows and 0 <= next_col < grid_cols):
                 continue
 
-            next_pos = (next_row, next_col)
+            next_pos = next_row * grid_cols + next_col
+            next_heuristic = heuristic[next_pos]
 
             # Obstacle check
-            if potential[next_row][next_col] == float("inf"):
+            if math.isinf(next_heuristic):
                 continue
 
             # Edge cost (diagonal movements are longer)
-            edge_cost = math.sqrt(2) if (delta_row != 0 and delta_col != 0) else 1.0
             new_accumulated_cost = accumulated_cost + edge_cost
 
             # Update if better path found
-            if next_pos not in cost_map or new_accumulated_cost < cost_map[next_pos]:
-                cost_map[next_pos] = new_accumulated_cost
-                estimated_total = new_accumulated_cost + potential[next_row][next_col]
-                updated_trajectory = trajectory + [next_pos]
-                heappush(frontier, (estimated_total, new_accumulated_cost, next_pos, updated_trajectory))
+            if new_accumulated_cost < g_score[next_pos]:
+                g_score[next_pos] = new_accumulated_cost
+                parent[next_pos] = current_pos
+                estimated_total = new_accumulated_cost + next_heuristic
+                if pending_entry is not None:
+                    heappush(frontier, pending_entry)
+                pending_entry = (estimated_total, new_accumulated_cost, next_pos)
 
     return [], explored_nodes
 
 
+def reconstruct_path(parent, grid_cols, start, goal):
+    """
+    Walks a flat-indexed parent array back from goal to start.
+
+    Returns:
+        list of (row, col) waypoints from start to goal
+    """
+    start_index = start[0] * grid_cols + start[1]
+    current = goal[0] * grid_cols + goal[1]
+
+    flat_waypoints = [current]
+    while current != start_index:
+        current = int(parent[current])
+        flat_waypoints.append(current)
+    flat_waypoints.reverse()
+
+    return [divmod(index, grid_cols) for index in flat_waypoints]
+
+
 def compute_gradient_path(potential, start, goal):
     """
     Performs steepest gradient descent on the potential field.
@@ -119,42 +185,45 @@ def compute_gradient_path(potential, start, goal):
     current_pos = start
     position_history = deque(maxlen=20)  # Circular buffer for cycle detection
     position_history.append(start)
+    history_counts = Counter({start: 1})  # Occurrences of each position in the buffer
 
-    step_limit = len(potential) * len(potential[0]) * 2
+    grid_rows, grid_cols = potential.shape
+    step_limit = grid_rows * grid_cols * 2
+
+    # Pad once with impassable cells so every neighbourhood read is in bounds
+    padded_potential = np.pad(potential, 1, constant_values=np.inf)
 
     for step_num in range(step_limit):
         if current_pos == goal:
             return waypoints
 
         row, col = current_pos
-        lowest_neighbor = None
-        lowest_potential = float("inf")
-
-        # Identify neighbor with minimum potential value
-        for delta_row, delta_col in DIRECTION_OFFSETS:
-            next_row, next_col = row + delta_row, col + delta_col
 
-            if 0 <= next_row < len(potential) and 0 <= next_col < len(potential[0]):
-                neighbor_pos = (next_row, next_col)
-                neighbor_potential = potential[next_row][next_col]
+        # Identify neighbor with minimum potential value (ties keep DIRECTION_OFFSETS order)
+        neighbor_potentials = padded_potential[row + 1 + DIR_DR, col + 1 + DIR_DC]
+        k = int(np.argmin(neighbor_potentials))
+        lowest_potential = neighbor_potentials[k]
+        lowest_neighbor = (row + int(DIR_DR[k]), col + int(DIR_DC[k]))
 
-                if neighbor_potential < lowest_potential:
-                    lowest_potential = neighbor_potential
-                    lowest_neighbor = neighbor_pos
-
-        if lowest_neighbor is None or lowest_potential == float("inf"):
+        if np.isinf(lowest_potential):
             print("Gradient descent halted: no reachable neighbors.")
             return waypoints
 
         # Cycle detection logic
-        if step_num > 10 and lowest_neighbor in position_history:
-            repetition_count = list(position_history).count(lowest_neighbor)
-            if repetition_count > 2:
-                print("Gradient descent halted: cyclic trajectory detected.")
-                return waypoints
+        if step_num > 10 and history_counts[lowest_neighbor] > 2:
+            print("Gradient descent halted: cyclic trajectory detected.")
+            return waypoints
+
+        # Keep counts in step with the oldest entry evicted from the buffer
+        if len(position_history) == position_history.maxlen:
+            evicted_pos = position_history[0]
+            history_counts[evicted_pos] -= 1
+            if not history_counts[evicted_pos]:
+                del history_counts[evicted_pos]
 
         waypoints.append(lowest_neighbor)
         position_history.append(lowest_neighbor)
+        history_counts[lowest_neighbor] += 1
         current_pos = lowest_neighbor
 
     print("Gradient descent halted: maximum step limit reached.")
@@ -0,0 +1,73 @@
+import os
+import hashlib
+import numpy as np
+from planner.potential_field import compute_potential_field
+from config.settings import (
+    ATTRACTIVE_GAIN,
+    REPULSIVE_GAIN,
+    OBSTACLE_INFLUENCE
+)
+
+CACHE_DIR = os.path.join("output", ".cache")
+
+# Version of the cached field format, bump whenever compute_potential_field changes its output
+CACHE_VERSION = 2
+
+def potential_cache_key(map_file, goal, robot_width, robot_height):
+    """
+    Builds a content hash identifying a potential field.
+
+    Args:
+        map_file: path to the map text file
+        goal: target position (row, col)
+        robot_width: robot width used for obstacle inflation
+        robot_height: robot height used for obstacle inflation
+
+    Returns:
+        hex digest string
+    """
+    digest = hashlib.sha1()
+
+    with open(map_file, "rb") as f:
+        digest.update(f.read())
+
+    # Any parameter that changes the field must be part of the key
+    parameters = (CACHE_VERSION, tuple(goal), robot_width, robot_height,
+                  ATTRACTIVE_GAIN, REPULSIVE_GAIN, OBSTACLE_INFLUENCE)
+    digest.update(repr(parameters).encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+def load_or_compute_potential_field(map_file, inflated_grid, goal, robot_width, robot_height,
+                                    cache_dir=CACHE_DIR):
+    """
+    Returns the potential field for a map, reusing a cached copy on disk when available.
+
+    Args:
+        map_file: path to the map text file the grid was loaded from
+        inflated_grid: occupancy grid with obstacles already inflated
+        goal: target position (row, col)
+        robot_width: robot width used for obstacle inflation
+        robot_height: robot height used for obstacle inflation
+        cache_dir: directory holding cached .npy fields
+
+    Returns:
+        2D float32 ndarray of potential values
+    """
+    key = potential_cache_key(map_file, goal, robot_width, robot_height)
+    cache_file = os.path.join(cache_dir, f"{key}.npy")
+
+    if os.path.exists(cache_file):
+        return np.load(cache_file)
+
+    potential = compute_potential_field(inflated_grid, goal)
+
+    # Write to a temporary file first so concurrent runs never read a partial field
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(temp_file, "wb") as f:
+        np.save(f, potential)
+    os.replace(temp_file, cache_file)
+
+    return potential
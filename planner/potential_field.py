@@ -1,9 +1,13 @@
-import math
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from scipy.ndimage import distance_transform_edt
+from map.grid_loader import to_obstacle_mask
 from config.settings import (
     ATTRACTIVE_GAIN,
     REPULSIVE_GAIN,
     OBSTACLE_INFLUENCE,
-    OBSTACLE
+    NUMBA_MIN_CELLS
 )
 
 def compute_potential_field(grid, goal):
@@ -11,65 +15,82 @@ def compute_potential_field(grid, goal):
     Generates navigation potential field combining attractive and repulsive forces.
 
     Args:
-        grid: 2D occupancy grid
+        grid: 2D occupancy grid or bool obstacle mask
         goal: target position (row, col)
 
     Returns:
-        2D array of potential values
-    """
-    num_rows = len(grid)
-    num_cols = len(grid[0])
-
-    potential_field = [[0.0 for _ in range(num_cols)] for _ in range(num_rows)]
+        2D float32 ndarray of potential values (obstacles are inf)
 
-    for row_idx in range(num_rows):
-        for col_idx in range(num_cols):
-
-            if grid[row_idx][col_idx] == OBSTACLE:
-                potential_field[row_idx][col_idx] = float("inf")
-                continue
+    Fields are cached on disk by planner.potential_cache, bump its CACHE_VERSION
+    whenever the values computed here change.
+    """
+    obstacle_mask = np.ascontiguousarray(to_obstacle_mask(grid))
 
-            # Attractive component: pulls robot toward goal
-            # Larger distance → higher potential
-            goal_distance = math.dist((row_idx, col_idx), goal)
-            attractive_potential = ATTRACTIVE_GAIN * goal_distance
+    # Repulsive component only depends on the obstacles, reuse it across goals
+    repulsive_potential = compute_repulsive_potential(obstacle_mask)
 
-            # Repulsive component: pushes robot away from obstacles
-            obstacle_distance = compute_nearest_obstacle_distance(grid, row_idx, col_idx)
+    # Fused kernel writes every cell once without intermediate field arrays
+    # Only imported for large grids, where it outweighs numba's import and load cost
+    if obstacle_mask.size >= NUMBA_MIN_CELLS:
+        from planner._potential_numba import NUMBA_AVAILABLE, build_potential_field
+        if NUMBA_AVAILABLE:
+            return build_potential_field(obstacle_mask, repulsive_potential,
+                                         goal[0], goal[1], ATTRACTIVE_GAIN)
 
-            if obstacle_distance <= OBSTACLE_INFLUENCE:
-                repulsive_potential = REPULSIVE_GAIN * (1.0 / obstacle_distance - 1.0 / OBSTACLE_INFLUENCE) ** 2
-            else:
-                repulsive_potential = 0
+    # Attractive component: pulls robot toward goal
+    # Larger distance → higher potential
+    row_indices, col_indices = np.indices(obstacle_mask.shape, dtype=np.float32)
+    attractive_potential = ATTRACTIVE_GAIN * np.hypot(row_indices - goal[0], col_indices - goal[1])
 
-            # Superposition of potential fields
-            potential_field[row_idx][col_idx] = attractive_potential + repulsive_potential
+    # Superposition of potential fields, obstacles are impassable
+    potential_field = np.empty(obstacle_mask.shape, dtype=np.float32)
+    potential_field[...] = attractive_potential + repulsive_potential
+    potential_field[obstacle_mask] = np.inf
 
     return potential_field
 
 
-def compute_nearest_obstacle_distance(grid, row, col):
+# Repulsive fields for recently seen obstacle layouts, oldest first
+REPULSIVE_CACHE_SIZE = 8
+_REPULSIVE_CACHE = OrderedDict()
+
+def compute_repulsive_potential(obstacle_mask):
     """
-    Calculates Euclidean distance from given position to closest obstacle.
+    Computes the goal-independent repulsive field, cached per obstacle layout.
+    Layouts are keyed by a digest of the mask so the cache never holds mask copies.
 
     Args:
-        grid: 2D occupancy grid
-        row: query row index
-        col: query column index
+        obstacle_mask: C-contiguous 2D bool obstacle mask
 
     Returns:
-        minimum distance to any obstacle cell
+        read-only 2D float32 array of repulsive potential values
     """
-    num_rows = len(grid)
-    num_cols = len(grid[0])
-
-    minimum_distance = float("inf")
-
-    for obstacle_row in range(num_rows):
-        for obstacle_col in range(num_cols):
-            if grid[obstacle_row][obstacle_col] == OBSTACLE:
-                distance = math.dist((row, col), (obstacle_row, obstacle_col))
-                if distance < minimum_distance:
-                    minimum_distance = distance
-
-    return minimum_distance
+    shape = obstacle_mask.shape
+    key = (hashlib.sha1(obstacle_mask).hexdigest(), shape)
+    if key in _REPULSIVE_CACHE:
+        _REPULSIVE_CACHE.move_to_end(key)
+        return _REPULSIVE_CACHE[key]
+
+    # Repulsive component: pushes robot away from obstacles
+    # Exact Euclidean distance from every cell to its nearest obstacle in one pass
+    if obstacle_mask.any():
+        obstacle_distance = distance_transform_edt(~obstacle_mask)
+    else:
+        obstacle_distance = np.full(shape, np.inf)
+
+    with np.errstate(divide="ignore"):
+        repulsive_potential = np.where(
+            obstacle_distance <= OBSTACLE_INFLUENCE,
+            REPULSIVE_GAIN * (1.0 / obstacle_distance - 1.0 / OBSTACLE_INFLUENCE) ** 2,
+            0.0
+        )
+
+    # Stored at the field's float32 precision, the cached array is shared and must not be modified
+    repulsive_potential = repulsive_potential.astype(np.float32)
+    repulsive_potential.flags.writeable = False
+
+    _REPULSIVE_CACHE[key] = repulsive_potential
+    if len(_REPULSIVE_CACHE) > REPULSIVE_CACHE_SIZE:
+        _REPULSIVE_CACHE.popitem(last=False)
+
+    return repulsive_potential
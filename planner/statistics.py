@@ -1,5 +1,7 @@
 import time
 import math
+import numpy as np
+from config.settings import OBSTACLE
 
 class PlanningStatistics:
     """
@@ -38,10 +40,11 @@ class PlanningStatistics:
 
     def set_map_info(self, grid, robot_width, robot_height):
         """Store map-related information."""
-        self.map_size = (len(grid), len(grid[0]) if grid else 0)
+        grid = np.asarray(grid)
+        self.map_size = grid.shape if grid.ndim == 2 else (0, 0)
 
         # Count obstacles
-        self.num_obstacles = sum(row.count(1) for row in grid)
+        self.num_obstacles = int(np.count_nonzero(grid == OBSTACLE))
 
         self.robot_size = (robot_height, robot_width)
 
@@ -9,16 +9,19 @@ Usage:
     python run_scenarios.py --list             # List all available scenarios
 """
 
+import io
 import sys
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib
 matplotlib.use("Agg")
 
 from map.grid_loader import load_grid
-from planner.potential_field import compute_potential_field
+from planner.potential_cache import load_or_compute_potential_field
 from planner.path_extractor import extract_path
 from planner.statistics import PlanningStatistics
 from visualization.draw_path import draw_path
-from visualization.draw_animation import create_animation
+from visualization.draw_animation import create_animation, ANIMATION_EXTENSION
 from visualization.draw_benchmark import create_single_scenario_benchmark, create_benchmark_chart
 from robot.exporter import export_path
 from robot.shape_handler import inflate_obstacles
@@ -132,7 +135,7 @@ def run_scenario(scenario_num, scenario_config):
         # Load map
         grid, start, goal = load_grid(scenario_config['map_file'])
         print(f"Start: {start}, Goal: {goal}")
-        print(f"Grid Size: {len(grid)}x{len(grid[0])} cells")
+        print(f"Grid Size: {grid.shape[0]}x{grid.shape[1]} cells")
 
         # Set up statistics
         stats.set_map_info(grid, scenario_config['robot_width'], scenario_config['robot_height'])
@@ -144,7 +147,9 @@ def run_scenario(scenario_num, scenario_config):
         # Compute potential field
         print("Computing potential field...")
         stats.start_timer()
-        potential = compute_potential_field(inflated_grid, goal)
+        potential = load_or_compute_potential_field(scenario_config['map_file'], inflated_grid, goal,
+                                                    scenario_config['robot_width'],
+                                                    scenario_config['robot_height'])
 
         # Extract path
         print("Extracting path...")
@@ -179,7 +184,7 @@ def run_scenario(scenario_num, scenario_config):
 
         # Create animation
         if success:
-            animation_path = f"output/scenario{scenario_num}_animation.gif"
+            animation_path = f"output/scenario{scenario_num}_animation{ANIMATION_EXTENSION}"
             print(f"\nGenerating robot animation...")
             create_animation(grid, path, scenario_config['robot_width'],
                            scenario_config['robot_height'],
@@ -213,6 +218,15 @@ def run_scenario(scenario_num, scenario_config):
         }
 
 
+def _run_one(scenario_num):
+    """Run a scenario by number in a worker process, returning (result, captured output)"""
+    # Buffer progress output so parallel scenarios don't interleave on stdout
+    log = io.StringIO()
+    with redirect_stdout(log):
+        result = run_scenario(scenario_num, SCENARIOS[scenario_num])
+    return result, log.getvalue()
+
+
 def list_scenarios():
     """Display all available scenarios"""
     print("\n" + "="*70)
@@ -285,11 +299,17 @@ def main():
     import os
     os.makedirs("output", exist_ok=True)
 
-    # Run scenarios
-    results = []
-    for num in scenario_nums:
-        result = run_scenario(num, SCENARIOS[num])
-        results.append(result)
+    # Run scenarios in parallel, each one is independent
+    max_workers = min(len(scenario_nums), os.cpu_count() or 1)
+    if max_workers == 1:
+        # A single worker gains nothing over running in this process
+        results = [run_scenario(num, SCENARIOS[num]) for num in scenario_nums]
+    else:
+        results = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for result, log in executor.map(_run_one, scenario_nums):
+                print(log, end="")
+                results.append(result)
 
     # Print summary if multiple scenarios
     if len(results) > 1:
@@ -1,18 +1,26 @@
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib.patches import Rectangle
-from config.settings import FREE, OBSTACLE, START, GOAL
+import numpy as np
+from visualization.draw_map import CELL_INTENSITY, show_grid_image
 
-def create_animation(grid, path, robot_width, robot_height, output_file="robot_animation.gif", scenario_info=None):
+# Natively encoded MP4 when FFmpeg is installed, Pillow GIF otherwise
+ANIMATION_EXTENSION = ".mp4" if animation.writers.is_available("ffmpeg") else ".gif"
+
+def create_animation(grid, path, robot_width, robot_height, output_file="robot_animation" + ANIMATION_EXTENSION,
+                     scenario_info=None):
     """
-    Creates an animated GIF showing the robot moving along the path.
+    Creates an animation (MP4 via FFmpeg, or GIF) showing the robot moving along the path.
 
     Args:
         grid: 2D occupancy grid
         path: list of (row, col) tuples representing the path
         robot_width: robot width in grid cells
         robot_height: robot height in grid cells
-        output_file: where to save the animation (default: "robot_animation.gif")
+        output_file: where to save the animation, a .gif extension selects the Pillow
+                     writer (default: "robot_animation" + ANIMATION_EXTENSION)
         scenario_info: dict with scenario metadata (optional)
     """
 
@@ -20,24 +28,18 @@ def create_animation(grid, path, robot_width, robot_height, output_file="robot_a
         print("No path to animate")
         return
 
-    color_map = {
-        FREE: 1.0,
-        OBSTACLE: 0.0,
-        START: 0.5,
-        GOAL: 0.7
-    }
-
-    image = [[color_map[cell] for cell in row] for row in grid]
+    image = CELL_INTENSITY[np.asarray(grid, dtype=np.uint8)]
 
     # Create figure
     fig, ax = plt.subplots(figsize=(10, 8))
 
     # Display the grid
-    ax.imshow(image, cmap="gray", alpha=0.8)
+    show_grid_image(ax, image, alpha=0.8)
 
     # Plot the planned path
-    y_coords = [p[1] for p in path]
-    x_coords = [p[0] for p in path]
+    path_points = np.asarray(path, dtype=np.int32).reshape(-1, 2)
+    y_coords = path_points[:, 1]
+    x_coords = path_points[:, 0]
     ax.plot(y_coords, x_coords, 'b--', linewidth=1, alpha=0.5, label="Planned Path")
 
     # Mark start and goal
@@ -64,36 +66,28 @@ def create_animation(grid, path, robot_width, robot_height, output_file="robot_a
     ax.legend(loc='upper right')
     plt.tight_layout()
 
-    def init():
-        """Initialize animation"""
-        robot_patch.set_xy((path[0][1] - robot_width/2, path[0][0] - robot_height/2))
-        progress_text.set_text('Progress: 0%')
-        return robot_patch, progress_text
-
-    def animate(frame):
-        """Update function for each frame"""
-        if frame < len(path):
-            pos = path[frame]
-            # Center the robot on the path point
-            robot_patch.set_xy((pos[1] - robot_width/2, pos[0] - robot_height/2))
-
-            # Update progress
-            progress = (frame + 1) / len(path) * 100
-            progress_text.set_text(f'Progress: {progress:.1f}% ({frame + 1}/{len(path)})')
-
-        return robot_patch, progress_text
-
-    # Create animation
     # Use fewer frames for smoother animation
     frames = min(len(path), 100)  # Cap at 100 frames
-    frame_indices = [int(i * len(path) / frames) for i in range(frames)]
+    frame_indices = np.arange(frames) * len(path) // frames
 
-    anim = animation.FuncAnimation(fig, animate, init_func=init,
-                                  frames=frame_indices, interval=100,
-                                  blit=True, repeat=True)
+    # Precompute per-frame robot corner (centered on the path point) and progress label
+    robot_corners = np.column_stack((path_points[frame_indices, 1] - robot_width/2,
+                                     path_points[frame_indices, 0] - robot_height/2))
+    progress_labels = [f'Progress: {(i + 1) / len(path) * 100:.1f}% ({i + 1}/{len(path)})'
+                       for i in frame_indices]
 
     # Save animation
     print(f"Creating animation with {len(frame_indices)} frames...")
-    anim.save(output_file, writer='pillow', fps=10, dpi=100)
+    if output_file.lower().endswith(".gif"):
+        writer = animation.PillowWriter(fps=10)
+    else:
+        writer = animation.FFMpegWriter(fps=10, bitrate=1800)
+
+    # Update the moving artists and grab each frame directly, without FuncAnimation bookkeeping
+    with writer.saving(fig, output_file, dpi=100):
+        for robot_corner, progress_label in zip(robot_corners, progress_labels):
+            robot_patch.set_xy(robot_corner)
+            progress_text.set_text(progress_label)
+            writer.grab_frame()
     plt.close()
     print(f"Animation saved to {output_file}")
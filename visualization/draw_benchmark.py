@@ -1,6 +1,26 @@
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
 import numpy as np
 
+# Figures reused across calls, keyed by figure size
+# Built without pyplot so they never become the current figure of other modules
+_FIGURES = {}
+
+def _get_benchmark_figure(figsize):
+    """
+    Returns a cleared 2x2 figure of the given size, creating it on first use.
+    """
+    if figsize not in _FIGURES:
+        _FIGURES[figsize] = Figure(figsize=figsize, layout="constrained")
+
+    # Rebuild the axes so no state from the previous chart carries over
+    fig = _FIGURES[figsize]
+    fig.clear()
+    axes = fig.subplots(2, 2)
+    return fig, axes
+
+
 def create_benchmark_chart(results, output_file="benchmark_chart.png"):
     """
     Creates a benchmark chart comparing multiple scenario results.
@@ -31,8 +51,15 @@ def create_benchmark_chart(results, output_file="benchmark_chart.png"):
             planning_times.append(0)
             nodes_explored.append(0)
 
+    # Array views for masked summaries and label offsets
+    path_length_array = np.asarray(path_lengths)
+    planning_time_array = np.asarray(planning_times)
+    path_length_max = path_length_array.max()
+    planning_time_max = planning_time_array.max()
+    nodes_explored_max = max(nodes_explored)
+
     # Create figure with subplots
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = _get_benchmark_figure((14, 10))
     fig.suptitle('Scenario Performance Benchmark', fontsize=16, fontweight='bold')
 
     # Color code by success/failure
@@ -51,7 +78,7 @@ def create_benchmark_chart(results, output_file="benchmark_chart.png"):
     # Add value labels on bars
     for i, (bar, val) in enumerate(zip(bars1, path_lengths)):
         if val > 0:
-            ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(path_lengths)*0.01,
+            ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + path_length_max*0.01,
                     str(val), ha='center', va='bottom', fontsize=9)
 
     # 2. Planning Time Comparison
@@ -67,7 +94,7 @@ def create_benchmark_chart(results, output_file="benchmark_chart.png"):
     # Add value labels
     for i, (bar, val) in enumerate(zip(bars2, planning_times)):
         if val > 0:
-            ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(planning_times)*0.01,
+            ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + planning_time_max*0.01,
                     f'{val:.1f}', ha='center', va='bottom', fontsize=9)
 
     # 3. Nodes Explored Comparison
@@ -83,7 +110,7 @@ def create_benchmark_chart(results, output_file="benchmark_chart.png"):
     # Add value labels
     for i, (bar, val) in enumerate(zip(bars3, nodes_explored)):
         if val > 0:
-            ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(nodes_explored)*0.01,
+            ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + nodes_explored_max*0.01,
                     str(val), ha='center', va='bottom', fontsize=9)
 
     # 4. Success Rate Summary
@@ -102,13 +129,18 @@ def create_benchmark_chart(results, output_file="benchmark_chart.png"):
     )
     ax4.set_title(f'Success Rate: {success_count}/{total_count}', fontsize=12, fontweight='bold')
 
-    # Add summary statistics as text
+    # Add summary statistics as text (averages over non-zero entries only)
+    positive_lengths = path_length_array[path_length_array > 0]
+    positive_times = planning_time_array[planning_time_array > 0]
+    avg_path_length = positive_lengths.mean() if positive_lengths.size else 0.0
+    avg_planning_time = positive_times.mean() if positive_times.size else 0.0
+
     summary_text = (
         f"Total Scenarios: {total_count}\n"
         f"Successful: {success_count}\n"
         f"Failed: {fail_count}\n"
-        f"Avg Path Length: {np.mean([p for p in path_lengths if p > 0]):.1f}\n"
-        f"Avg Planning Time: {np.mean([t for t in planning_times if t > 0]):.2f} ms"
+        f"Avg Path Length: {avg_path_length:.1f}\n"
+        f"Avg Planning Time: {avg_planning_time:.2f} ms"
     )
 
     ax4.text(0.02, 0.02, summary_text,
@@ -117,9 +149,7 @@ def create_benchmark_chart(results, output_file="benchmark_chart.png"):
             verticalalignment='bottom',
             bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
 
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_file, dpi=150, pil_kwargs={'compress_level': 1})
     print(f"Benchmark chart saved to {output_file}")
 
 
@@ -134,7 +164,7 @@ def create_single_scenario_benchmark(scenario_num, scenario_name, stats, output_
         output_file: where to save the chart
     """
 
-    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+    fig, axes = _get_benchmark_figure((12, 10))
     fig.suptitle(f'Scenario {scenario_num}: {scenario_name} - Performance Metrics',
                 fontsize=14, fontweight='bold')
 
@@ -155,7 +185,8 @@ def create_single_scenario_benchmark(scenario_num, scenario_name, stats, output_
     ax1 = axes[0, 0]
     metrics = ['Planning\nTime (ms)', 'Nodes\nExplored', 'Path\nLength', 'Path\nCost']
     values = [planning_time_ms, nodes_explored, path_length, path_cost]
-    normalized_values = [v / max(values) * 100 for v in values]
+    values_max = max(values)
+    normalized_values = [v / values_max * 100 for v in values]
 
     bars = ax1.barh(metrics, normalized_values, color=['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728'])
     ax1.set_xlabel('Normalized Value (%)', fontsize=10)
@@ -208,8 +239,9 @@ def create_single_scenario_benchmark(scenario_num, scenario_name, stats, output_
         ax3.grid(axis='y', alpha=0.3)
 
         # Add value labels
+        quality_max = max(quality_values)
         for bar, val in zip(bars3, quality_values):
-            ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(quality_values)*0.01,
+            ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + quality_max*0.01,
                     f'{val:.2f}', ha='center', va='bottom', fontsize=9)
     else:
         ax3.text(0.5, 0.5, 'No Path Found', ha='center', va='center',
@@ -249,7 +281,5 @@ def create_single_scenario_benchmark(scenario_num, scenario_name, stats, output_
                 transform=ax4.transAxes, fontsize=14, color='gray')
         ax4.set_title('Exploration Efficiency', fontsize=11, fontweight='bold')
 
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_file, dpi=150, pil_kwargs={'compress_level': 1})
     print(f"Scenario benchmark chart saved to {output_file}")
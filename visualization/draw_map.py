@@ -1,20 +1,69 @@
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+import numpy as np
 from config.settings import FREE, OBSTACLE, START, GOAL
 
+# Simplify and chunk long path polylines so Agg draws them quickly
+plt.rcParams["path.simplify"] = True
+plt.rcParams["agg.path.chunksize"] = 10000
+
+# Display intensity for each cell type, indexed directly by cell value
+CELL_INTENSITY = np.zeros(256, dtype=np.float32)
+CELL_INTENSITY[FREE] = 1.0        # white
+CELL_INTENSITY[OBSTACLE] = 0.0    # black
+CELL_INTENSITY[START] = 0.5       # gray
+CELL_INTENSITY[GOAL] = 0.7        # light gray
+
+# Largest grid side drawn at full resolution, bigger grids are pooled for display
+MAX_DISPLAY_CELLS = 1500
+
+def downsample_for_display(image):
+    """
+    Min-pools large intensity images to at most MAX_DISPLAY_CELLS per side.
+    Min-pooling keeps obstacles (intensity 0.0) visible at the reduced size.
+
+    Returns:
+        tuple: (display_image, extent) where extent maps the pooled image back
+        onto grid coordinates, or None when the image is drawn unchanged
+    """
+    num_rows, num_cols = image.shape
+    factor = -(-max(num_rows, num_cols) // MAX_DISPLAY_CELLS)
+    if factor <= 1:
+        return image, None
+
+    # Pad with free space up to a multiple of the pooling factor
+    padded_rows = -(-num_rows // factor) * factor
+    padded_cols = -(-num_cols // factor) * factor
+    padded = np.pad(image, ((0, padded_rows - num_rows), (0, padded_cols - num_cols)),
+                    constant_values=CELL_INTENSITY[FREE])
+
+    pooled = padded.reshape(padded_rows // factor, factor, padded_cols // factor, factor).min(axis=(1, 3))
+    extent = (-0.5, padded_cols - 0.5, padded_rows - 0.5, -0.5)
+    return pooled, extent
+
+
+def show_grid_image(ax, image, **imshow_kwargs):
+    """
+    Draws an intensity image on the axes in grid coordinates, pooling large grids.
+    """
+    display_image, extent = downsample_for_display(image)
+    ax.imshow(display_image, cmap="gray", extent=extent, **imshow_kwargs)
+
+    # Keep the axes on the original grid even if pooling padded the image
+    if extent is not None:
+        num_rows, num_cols = image.shape
+        ax.set_xlim(-0.5, num_cols - 0.5)
+        ax.set_ylim(num_rows - 0.5, -0.5)
+
+
 def draw_map(grid):
     """
     Draws the occupancy grid using matplotlib.
     """
-    color_map = {
-        FREE: 1.0,        # white
-        OBSTACLE: 0.0,    # black
-        START: 0.5,       # gray
-        GOAL: 0.7         # light gray
-    }
-
     # Convert grid to color intensities
-    image = [[color_map[cell] for cell in row] for row in grid]
+    image = CELL_INTENSITY[np.asarray(grid, dtype=np.uint8)]
 
-    plt.imshow(image, cmap="gray")
+    show_grid_image(plt.gca(), image)
     plt.title("Occupancy Grid")
     plt.savefig("map_output.png")
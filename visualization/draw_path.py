@@ -1,5 +1,24 @@
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
-from config.settings import FREE, OBSTACLE, START, GOAL
+import numpy as np
+from matplotlib.collections import LineCollection
+from visualization.draw_map import CELL_INTENSITY, show_grid_image
+
+# Paths with at least this many waypoints are drawn as a single segment collection
+LINE_COLLECTION_MIN_POINTS = 200
+
+def figure_size_for_grid(num_rows, num_cols, max_width=10, max_height=8, margin=1.0):
+    """
+    Fits the grid's aspect ratio into a max_width x max_height inch figure.
+    The margin leaves room for the title and tick labels around the grid.
+
+    Returns:
+        tuple: (width, height) in inches
+    """
+    scale = min((max_width - margin) / num_cols, (max_height - margin) / num_rows)
+    return (num_cols * scale + margin, num_rows * scale + margin)
+
 
 def draw_path(grid, path, output_file="path_output.png", title=None, scenario_info=None):
     """
@@ -13,26 +32,27 @@ def draw_path(grid, path, output_file="path_output.png", title=None, scenario_in
         scenario_info: dict with scenario metadata for enhanced visualization (optional)
     """
 
-    color_map = {
-        FREE: 1.0,
-        OBSTACLE: 0.0,
-        START: 0.5,
-        GOAL: 0.7
-    }
-
-    image = [[color_map[cell] for cell in row] for row in grid]
+    image = CELL_INTENSITY[np.asarray(grid, dtype=np.uint8)]
 
-    # Create figure with better size
-    fig, ax = plt.subplots(figsize=(10, 8))
-    ax.imshow(image, cmap="gray")
+    # Size the figure to the grid so wide or tall maps don't leave blank margins
+    fig, ax = plt.subplots(figsize=figure_size_for_grid(*image.shape), constrained_layout=True)
+    show_grid_image(ax, image)
 
     # Extract x and y coordinates of the path
-    y_coords = [p[1] for p in path]  # column = x axis
-    x_coords = [p[0] for p in path]  # row = y axis
+    path_points = np.asarray(path, dtype=np.int32).reshape(-1, 2)
+    y_coords = path_points[:, 1]  # column = x axis
+    x_coords = path_points[:, 0]  # row = y axis
 
     # Plot path with start and end markers
     if path:
-        ax.plot(y_coords, x_coords, color="red", linewidth=2, label="Path", zorder=5)
+        if len(path_points) >= LINE_COLLECTION_MIN_POINTS:
+            # Segments between consecutive (x, y) points, drawn in one vectorized pass
+            xy_points = path_points[:, ::-1]
+            segments = np.stack([xy_points[:-1], xy_points[1:]], axis=1)
+            ax.add_collection(LineCollection(segments, colors="red", linewidths=2,
+                                             label="Path", zorder=5))
+        else:
+            ax.plot(y_coords, x_coords, color="red", linewidth=2, label="Path", zorder=5)
         ax.plot(y_coords[0], x_coords[0], 'go', markersize=12, label="Start", zorder=6)
         ax.plot(y_coords[-1], x_coords[-1], 'b*', markersize=15, label="Goal", zorder=6)
         ax.legend(loc='upper right')
@@ -65,7 +85,6 @@ def draw_path(grid, path, output_file="path_output.png", title=None, scenario_in
                    verticalalignment='top',
                    bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
 
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=150, bbox_inches='tight')
+    plt.savefig(output_file, dpi=150, pil_kwargs={'compress_level': 1})
     plt.close()
 